@@ -361,6 +361,10 @@ class Task:
 class GroupResult:
     """Contains information relating to a single group failure within a TestTask."""
 
+    # Instances are created in bulk when parsing task artifacts, so skip
+    # the per-instance __dict__.
+    __slots__ = ("group", "ok", "duration")
+
     group: str
     ok: bool
     # TODO: 'Optional' can be removed once https://github.com/mozilla/mozci/issues/662 is fixed.
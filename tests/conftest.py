@@ -3,26 +3,88 @@ import json
 import os
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import pytest
-from responses import RequestsMock
+from responses import RequestsMock, registries
+from tomlkit import parse
 
 import mozci
-from mozci import data
+from mozci import config, data
 from mozci.configuration import Configuration
 from mozci.data.base import DataHandler
+from mozci.data.sources.treeherder import (
+    BaseTreeherderSource,
+    TreeherderClientSource,
+    TreeherderDBSource,
+)
 from mozci.push import MAX_DEPTH, Push
 from mozci.util.hgmo import HgRev
+from mozci.util.taskcluster import get_index_url
+from mozci.util.yaml import load_yaml
 
 here = os.path.abspath(os.path.dirname(__file__))
 
 
 @pytest.fixture(autouse=True, scope="session")
-def set_config_path():
-    os.environ["MOZCI_CONFIG_PATH"] = os.path.join(here, "config.toml")
+def set_config_path(tmp_path_factory):
+    config_path = os.path.join(here, "config.toml")
+    os.environ["MOZCI_CONFIG_PATH"] = config_path
     mozci.config = Configuration()
     data.handler = DataHandler(*mozci.config.data_sources)
 
+    # Every module binds `from mozci import config` while pytest collects,
+    # before this fixture replaces `mozci.config` above, so the cache the
+    # tests actually exercise is the one on that import-time singleton.
+    # Rebuild it with the test settings and a file store path private to
+    # this process, so pytest-xdist workers never share (or race on) a
+    # store — nor pick up whatever cache a developer's real config
+    # defines.
+    with open(config_path) as fh:
+        cache_config = parse(fh.read())["mozci"]["cache"]
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    cache_config["stores"]["file"]["path"] = str(
+        tmp_path_factory.mktemp(f"mozci_tests_cache_{worker}")
+    )
+    config.update({"cache": cache_config})
+
+
+class FakeCache:
+    """Minimal stand-in for ``config.cache`` always returning a canned value.
+
+    Avoids patching individual methods of the live cache with per-test
+    lambdas and keeps any real cache backend out of the picture.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value=None):
+        self._value = value
+
+    def get(self, key):
+        return self._value
+
+    def put(self, key, value, minutes=None):
+        pass
+
+    def forget(self, key):
+        pass
+
+
+@pytest.fixture
+def fake_cache():
+    """Returns a factory that swaps config.cache for a FakeCache."""
+    original = config.cache
+
+    def inner(value=None):
+        cache = FakeCache(value)
+        # The Configuration object is locked, bypass its __setattr__.
+        object.__setattr__(config, "cache", cache)
+        return cache
+
+    yield inner
+    object.__setattr__(config, "cache", original)
+
 
 @pytest.fixture(autouse=True)
 def reset_hgmo_cache():
@@ -30,12 +92,127 @@ def reset_hgmo_cache():
     HgRev.CACHE = {}
 
 
+@pytest.fixture(autouse=True, scope="module")
+def reset_treeherder_caches():
+    """The treeherder sources memoize query results in-process, so one
+    module's mocked responses would otherwise leak into later modules
+    reusing the same (branch, rev) — e.g. test_push.py's empty
+    push_notes for autoland/abcdef poisoning test_data_sources.py.
+
+    Cleared per module rather than per test because the test_source
+    cases deliberately share the groups cache between consecutive
+    cases within their module."""
+    yield
+    TreeherderClientSource._run_query.cache_clear()
+    TreeherderDBSource._get_tasks.cache_clear()
+    BaseTreeherderSource.groups_cache.clear()
+
+
 @pytest.fixture
 def responses():
     with RequestsMock(assert_all_requests_are_fired=False) as rsps:
         yield rsps
 
 
+@pytest.fixture
+def ordered_responses():
+    """Like ``responses``, but backed by an OrderedRegistry.
+
+    Mocks are consumed from the head of the registry in registration
+    order, so each lookup is O(1) instead of a scan over all registered
+    matchers. Only usable by tests whose requests happen in a known,
+    fixed order.
+    """
+    with RequestsMock(
+        assert_all_requests_are_fired=False,
+        registry=registries.OrderedRegistry,
+    ) as rsps:
+        yield rsps
+
+
+@lru_cache(maxsize=256)
+def automation_relevance_url(branch, rev):
+    """Formats (and caches) the json-automationrelevance URL for a given
+    branch and revision, so repeated registrations don't reparse the
+    format string."""
+    return HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(branch=branch, rev=rev)
+
+
+AUTOMATION_RELEVANCE_URL_RE = re.compile(
+    r"https://hg\.mozilla\.org/(?P<branch>.+)/json-automationrelevance/(?P<rev>\w+)"
+)
+
+
+@pytest.fixture
+def register_automation_relevance(responses):
+    """Returns a helper that mocks the json-automationrelevance endpoint
+    for a given branch and revision.
+
+    All registrations share a single callback dispatching on the (branch,
+    rev) captured by a compiled regex, so `responses` doesn't have to walk
+    one matcher per registered revision on every request.
+    """
+    payloads = {}
+
+    def callback(request):
+        m = AUTOMATION_RELEVANCE_URL_RE.match(request.url)
+        key = (m.group("branch"), m.group("rev"))
+        if key not in payloads:
+            raise KeyError(f"no automationrelevance mock registered for {key}")
+        status, payload = payloads[key]
+        return status, {}, json.dumps(payload)
+
+    responses.add_callback(
+        responses.GET,
+        AUTOMATION_RELEVANCE_URL_RE,
+        callback=callback,
+        content_type="application/json",
+    )
+
+    def inner(branch, rev, json=None, status=200):
+        payloads[(branch, rev)] = (status, json)
+
+    return inner
+
+
+@pytest.fixture
+def register_decision_task(responses):
+    """Returns a helper that mocks the index lookup of a push's decision
+    task."""
+
+    def inner(branch, rev, task_id):
+        responses.add(
+            responses.GET,
+            get_index_url(f"gecko.v2.{branch}.revision.{rev}.taskgraph.decision"),
+            json={"taskId": task_id},
+            status=200,
+        )
+
+    return inner
+
+
+@pytest.fixture
+def add_responses_from_file(responses):
+    """Returns a helper that registers all mocks listed in a YAML
+    cassette file in a single call.
+
+    Mirrors the ``_add_from_file`` API that newer releases of
+    ``responses`` grew, which isn't available in the version pinned
+    here.
+    """
+
+    def inner(path):
+        for entry in load_yaml(str(path))["responses"]:
+            responses.add(
+                entry.get("method", "GET"),
+                entry["url"],
+                json=entry.get("json"),
+                status=entry.get("status", 200),
+            )
+
+    return inner
+
+
 @pytest.fixture
 def create_push(monkeypatch, responses):
     """Returns a factory method that creates a `Push` instance.
@@ -96,7 +273,7 @@ def create_push(monkeypatch, responses):
 
         responses.add_callback(
             responses.GET,
-            HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(branch=branch, rev=rev),
+            automation_relevance_url(branch, rev),
             callback=automationrelevance_callback,
             content_type="application/json",
         )
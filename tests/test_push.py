@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import json
+from functools import lru_cache
 from itertools import count
+from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -21,69 +25,80 @@ from mozci.util.taskcluster import (
     get_index_url,
 )
 
-SCHEDULES_EXTRACT = {
-    "tasks": {
-        "test-android-em-7.0-x86_64-lite-qr/debug-geckoview-junit-fis-e10s": 0.51,
-        "test-linux1804-64-qr/opt-telemetry-tests-client-fis-e10s": 0.52,
-    },
-    "groups": {
-        "toolkit/modules/tests/browser/browser.ini": 0.68,
-        "devtools/client/framework/test/browser.ini": 0.99,
-    },
-    "config_groups": {
-        "toolkit/modules/tests/browser/browser.ini": [
-            "test-linux1804-64-qr/opt-*-swr-e10s"
-        ],
-        "devtools/client/framework/test/browser.ini": [
-            "test-linux1804-64-qr/opt-*-e10s"
-        ],
-    },
-    "reduced_tasks": {
-        "test-android-em-7.0-x86_64-lite-qr/opt-geckoview-junit-fis-e10s": 0.88,
-        "test-linux1804-64-qr/debug-reftest-swr-e10s-2": 0.83,
-    },
-    "reduced_tasks_higher": {},
-    "known_tasks": [
-        "test-windows10-64-2004-qr/debug-web-platform-tests-swr-e10s-9",
-        "test-windows10-64-2004-qr/debug-mochitest-devtools-chrome-fis-e10s-1",
-    ],
+FILES = Path(__file__).parent / "files"
+
+# Static payloads kept as committed fixture files, parsed once at import
+# and treated as read-only by the tests.
+SCHEDULES_EXTRACT_BODY = (FILES / "schedules_extract.json").read_bytes()
+SCHEDULES_EXTRACT = json.loads(SCHEDULES_EXTRACT_BODY)
+
+# Automationrelevance payload shared by the push task tests.
+AUTOMATION_RELEVANCE_ABCDEF = {
+    "changesets": [{"node": "abcdef", "pushdate": [1638349140]}]
 }
 
+# Branches searched (in order) when looking for the parent of a try push.
+PARENT_SEARCH_BRANCHES = (
+    "mozilla-central",
+    "mozilla-beta",
+    "mozilla-release",
+    "integration/autoland",
+)
+
+# 40-char node ids ("aaa...", "bbb...", ...) used by the iterate tests.
+NODES = tuple(chr(ord("a") + i) * 40 for i in range(8))
+
 NUMBER_OF_DEFAULT_GROUPS = 5
 NUMBER_OF_INTERMITTENT_GROUPS_IN_DEFAULT = 2
-GROUP_SUMMARIES_DEFAULT = {
-    group.name: group
-    for group in [
-        GroupSummary(
-            f"group{i}",
-            [
+
+# Names of the default groups, plus the cross-config value vectors the
+# classify tables keep repeating. All consumers treat these as
+# read-only, so the same objects can be shared across cases.
+_GROUPS = tuple(f"group{i}" for i in range(1, NUMBER_OF_DEFAULT_GROUPS + 1))
+_ALL_CROSS_CONFIG = [True] * NUMBER_OF_DEFAULT_GROUPS
+_NO_CROSS_CONFIG = [False] * NUMBER_OF_DEFAULT_GROUPS
+_ALTERNATING_CROSS_CONFIG = [
+    False if i % 2 else True for i in range(NUMBER_OF_DEFAULT_GROUPS)
+]
+
+# Immutable empty set handed to generate_mocks wherever a case has no
+# likely/possible regressions, instead of allocating a fresh set().
+_NO_REGRESSIONS = frozenset()
+
+
+@lru_cache(maxsize=None)
+def _build_group_summaries_default():
+    """Build the default group summaries lazily, only once per session."""
+    summaries = {}
+    for i in range(1, NUMBER_OF_DEFAULT_GROUPS + 1):
+        tasks = [
+            Task.create(
+                id=j,
+                label=f"test-task{j}",
+                result="failed",
+                _results=[GroupResult(group=f"group{i}", ok=False, duration=42)],
+            )
+            for j in range(1, 4)
+        ]
+        if i <= NUMBER_OF_INTERMITTENT_GROUPS_IN_DEFAULT:
+            tasks.append(
                 Task.create(
-                    id=j,
-                    label=f"test-task{j}",
-                    result="failed",
-                    _results=[GroupResult(group=f"group{i}", ok=False, duration=42)],
+                    id=4,
+                    label="test-task1",
+                    result="passed",
+                    _results=[GroupResult(group=f"group{i}", ok=True, duration=42)],
                 )
-                for j in range(1, 4)
-            ]
-            + (
-                [
-                    Task.create(
-                        id=4,
-                        label="test-task1",
-                        result="passed",
-                        _results=[GroupResult(group=f"group{i}", ok=True, duration=42)],
-                    )
-                ]
-                if i <= NUMBER_OF_INTERMITTENT_GROUPS_IN_DEFAULT
-                else []
-            ),
-        )
-        for i in range(1, NUMBER_OF_DEFAULT_GROUPS + 1)
-    ]
-}
+            )
+        summaries[f"group{i}"] = GroupSummary(f"group{i}", tasks)
+    return summaries
+
+
+@pytest.fixture(scope="session")
+def group_summaries_default():
+    return _build_group_summaries_default()
 
 
-def test_group_summaries_default_status():
+def test_group_summaries_default_status(group_summaries_default):
     assert {
         **{
             f"group{i}": Status.INTERMITTENT
@@ -96,10 +111,22 @@ def test_group_summaries_default_status():
                 NUMBER_OF_DEFAULT_GROUPS + 1,
             )
         },
-    } == {g.name: g.status for g in GROUP_SUMMARIES_DEFAULT.values()}
+    } == {g.name: g.status for g in group_summaries_default.values()}
+
+
+@lru_cache(maxsize=256)
+def json_pushes_url(branch, push_id_start, push_id_end):
+    """Formats (and caches) the json-pushes URL for a given branch and
+    push id range."""
+    return HgRev.JSON_PUSHES_TEMPLATE.format(
+        branch=branch, push_id_start=push_id_start, push_id_end=push_id_end
+    )
 
 
+@lru_cache(maxsize=None)
 def make_tasks(group_id):
+    """Expected failed tasks for a group, built once per group id; the
+    classify tests only compare against the result."""
     return [
         TestTask(
             id=j,
@@ -111,6 +138,11 @@ def make_tasks(group_id):
     ]
 
 
+# Tests only read the generated changesets, so identical calls can share
+# the same list across the session.
+_changesets_cache = {}
+
+
 @pytest.fixture
 def create_changesets():
     """Return a set of changesets in automationrelevance format.
@@ -119,11 +151,13 @@ def create_changesets():
     """
 
     def node(i):
-        i = str(i)
-        pad = "0" * (40 - len(i))
-        return pad + i
+        return f"{i:040d}"
 
     def inner(num, extra=None, head=1):
+        key = (num, repr(extra), head)
+        if key in _changesets_cache:
+            return _changesets_cache[key]
+
         changesets = []
         for i in reversed(range(head, num + head)):
             c = {
@@ -138,17 +172,17 @@ def create_changesets():
 
             changesets.append(c)
 
+        _changesets_cache[key] = changesets
         return changesets
 
     return inner
 
 
-def test_create_push(responses):
+def test_create_push(responses, register_automation_relevance):
     def setup_responses(ctx):
-        responses.reset()
         responses.add(
             responses.GET,
-            HgRev.JSON_PUSHES_TEMPLATE.format(**ctx),
+            json_pushes_url(**ctx),
             json={
                 "pushes": {
                     "123": {
@@ -162,21 +196,11 @@ def test_create_push(responses):
             },
             status=200,
         )
-        responses.add(
-            responses.GET,
-            HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(
-                branch=ctx["branch"], rev="abcdef"
-            ),
-            json={"changesets": [{"node": "abcdef"}]},
-            status=200,
+        register_automation_relevance(
+            ctx["branch"], "abcdef", json={"changesets": [{"node": "abcdef"}]}
         )
-        responses.add(
-            responses.GET,
-            HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(
-                branch=ctx["branch"], rev="123456"
-            ),
-            json={"changesets": [{"node": "123456"}]},
-            status=200,
+        register_automation_relevance(
+            ctx["branch"], "123456", json={"changesets": [{"node": "123456"}]}
         )
 
     ctx = {
@@ -202,213 +226,86 @@ def test_create_push(responses):
     assert p2.branch in ctx["branch"]
 
 
-def test_push_tasks_with_tier(responses):
-    cache = config.cache
+def test_push_tasks_with_tier(
+    fake_cache,
+    responses,
+    register_automation_relevance,
+    register_decision_task,
+    add_responses_from_file,
+):
     rev = "abcdef"
     branch = "autoland"
 
-    TASKS_KEY = "{}/{}/tasks".format(branch, rev)
+    # Inject an empty cache instead of defensively clearing the real one,
+    # which could hit disk depending on the configured backend.
+    fake_cache()
 
-    # Making sure there's nothing left in the cache
-    if cache.get(TASKS_KEY):
-        cache.forget(TASKS_KEY)
-    assert cache.get(TASKS_KEY) is None
-
-    responses.add(
-        responses.GET,
-        f"https://hg.mozilla.org/integration/autoland/json-automationrelevance/{rev}",
-        json={"changesets": [{"node": rev, "pushdate": [1638349140]}]},
-        status=200,
-    )
-
-    responses.add(
-        responses.GET,
-        "https://firefox-ci-tc.services.mozilla.com/api/index/v1/task/gecko.v2.autoland.revision.abcdef.taskgraph.decision",
-        json={"taskId": 1},
-        status=200,
-    )
-
-    responses.add(
-        responses.GET,
-        "https://firefox-ci-tc.services.mozilla.com/api/queue/v1/task/1",
-        json={"taskGroupId": "xyz789"},
-        status=200,
-    )
-
-    responses.add(
-        responses.GET,
-        "https://firefox-ci-tc.services.mozilla.com/api/queue/v1/task-group/xyz789/list",
-        json={
-            "tasks": [
-                {
-                    "task": {
-                        "extra": {
-                            "treeherder": {"tier": 3},
-                        },
-                        "metadata": {
-                            "name": "task-A",
-                        },
-                        "tags": {"name": "tag-A"},
-                    },
-                    "status": {
-                        "taskId": "abc13",
-                        "state": "unscheduled",
-                    },
-                },
-                {
-                    "task": {
-                        "extra": {
-                            "treeherder": {"tier": 1},
-                        },
-                        "metadata": {
-                            "name": "task-B",
-                        },
-                        "tags": {"name": "tag-A"},
-                    },
-                    "status": {
-                        "taskId": "abc123",
-                        "state": "unscheduled",
-                    },
-                },
-            ]
-        },
-        status=200,
-    )
-
-    responses.add(
-        responses.GET,
-        "https://treeherder.mozilla.org/api/project/autoland/note/push_notes/?revision=abcdef&format=json",
-        json={},
-        status=200,
+    register_automation_relevance(
+        "integration/autoland", rev, json=AUTOMATION_RELEVANCE_ABCDEF
     )
+    register_decision_task(branch, rev, 1)
+    add_responses_from_file(FILES / "push_tasks_responses.yml")
 
     push = Push(rev, branch)
     tasks = push.tasks
-    print(len(tasks))
     assert len(tasks) == 1
 
 
-def test_push_tasks_with_cached_uncompleted_tasks(monkeypatch, responses):
+def test_push_tasks_with_cached_uncompleted_tasks(
+    fake_cache,
+    responses,
+    register_automation_relevance,
+    register_decision_task,
+    add_responses_from_file,
+):
     rev = "abcdef"
     branch = "autoland"
 
-    cached_tasks = [Task.create(id=1, label="test-task", state="running")]
-    monkeypatch.setattr(config.cache, "get", lambda x: cached_tasks)
-
-    responses.add(
-        responses.GET,
-        f"https://hg.mozilla.org/integration/autoland/json-automationrelevance/{rev}",
-        json={"changesets": [{"node": rev, "pushdate": [1638349140]}]},
-        status=200,
-    )
-
-    responses.add(
-        responses.GET,
-        "https://firefox-ci-tc.services.mozilla.com/api/index/v1/task/gecko.v2.autoland.revision.abcdef.taskgraph.decision",
-        json={"taskId": 1},
-        status=200,
-    )
-
-    responses.add(
-        responses.GET,
-        "https://firefox-ci-tc.services.mozilla.com/api/queue/v1/task/1",
-        json={"taskGroupId": "xyz789"},
-        status=200,
-    )
+    fake_cache([Task.create(id=1, label="test-task", state="running")])
 
-    responses.add(
-        responses.GET,
-        "https://firefox-ci-tc.services.mozilla.com/api/queue/v1/task-group/xyz789/list",
-        json={
-            "tasks": [
-                {
-                    "task": {
-                        "extra": {
-                            "treeherder": {"tier": 3},
-                        },
-                        "metadata": {
-                            "name": "task-A",
-                        },
-                        "tags": {"name": "tag-A"},
-                    },
-                    "status": {
-                        "taskId": "abc13",
-                        "state": "unscheduled",
-                    },
-                },
-                {
-                    "task": {
-                        "extra": {
-                            "treeherder": {"tier": 1},
-                        },
-                        "metadata": {
-                            "name": "task-B",
-                        },
-                        "tags": {"name": "tag-A"},
-                    },
-                    "status": {
-                        "taskId": "abc123",
-                        "state": "unscheduled",
-                    },
-                },
-            ]
-        },
-        status=200,
-    )
-
-    responses.add(
-        responses.GET,
-        "https://treeherder.mozilla.org/api/project/autoland/note/push_notes/?revision=abcdef&format=json",
-        json={},
-        status=200,
+    register_automation_relevance(
+        "integration/autoland", rev, json=AUTOMATION_RELEVANCE_ABCDEF
     )
+    register_decision_task(branch, rev, 1)
+    add_responses_from_file(FILES / "push_tasks_responses.yml")
 
     push = Push(rev, branch)
     tasks = push.tasks
     assert len(tasks) == 1
 
 
-def test_push_tasks_with_cached_completed_tasks(monkeypatch, responses):
+def test_push_tasks_with_cached_completed_tasks(
+    fake_cache, responses, register_automation_relevance, register_decision_task
+):
     rev = "abcdef"
     branch = "autoland"
 
-    cached_tasks = [
-        Task.create(id=1, label="test-task", result="passed", state="completed")
-    ]
-    monkeypatch.setattr(config.cache, "get", lambda x: cached_tasks)
-
-    responses.add(
-        responses.GET,
-        f"https://hg.mozilla.org/integration/autoland/json-automationrelevance/{rev}",
-        json={"changesets": [{"node": rev, "pushdate": [1638349140]}]},
-        status=200,
+    fake_cache(
+        [Task.create(id=1, label="test-task", result="passed", state="completed")]
     )
 
-    responses.add(
-        responses.GET,
-        "https://firefox-ci-tc.services.mozilla.com/api/index/v1/task/gecko.v2.autoland.revision.abcdef.taskgraph.decision",
-        json={"taskId": 1},
-        status=200,
+    register_automation_relevance(
+        "integration/autoland", rev, json=AUTOMATION_RELEVANCE_ABCDEF
     )
+    register_decision_task(branch, rev, 1)
 
     push = Push(rev, branch)
     tasks = push.tasks
     assert len(tasks) == 1
 
 
-def test_finalized_push_tasks_with_cache(monkeypatch, responses):
+def test_finalized_push_tasks_with_cache(
+    monkeypatch, fake_cache, responses, register_automation_relevance
+):
     rev = "abcdef"
     branch = "autoland"
 
     cached_tasks = [Task.create(id=1, label="test-task", result="passed")]
-    monkeypatch.setattr(config.cache, "get", lambda x: cached_tasks)
+    fake_cache(cached_tasks)
     monkeypatch.setattr(Push, "is_finalized", True)
 
-    responses.add(
-        responses.GET,
-        f"https://hg.mozilla.org/integration/autoland/json-automationrelevance/{rev}",
-        json={"changesets": [{"node": rev, "pushdate": [1638349140]}]},
-        status=200,
+    register_automation_relevance(
+        "integration/autoland", rev, json=AUTOMATION_RELEVANCE_ABCDEF
     )
 
     push = Push(rev, branch)
@@ -417,14 +314,12 @@ def test_finalized_push_tasks_with_cache(monkeypatch, responses):
     assert tasks == cached_tasks
 
 
-def test_push_does_not_exist(responses):
+def test_push_does_not_exist(register_automation_relevance):
     # We hit hgmo when 'rev' is less than 40 characters.
     rev = "foobar"
-    responses.add(
-        responses.GET,
-        HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(
-            branch="integration/autoland", rev="foobar"
-        ),
+    register_automation_relevance(
+        "integration/autoland",
+        rev,
         json={"error": f"unknown revision '{rev}'"},
         status=404,
     )
@@ -434,11 +329,9 @@ def test_push_does_not_exist(responses):
 
     # Otherwise we need to hit hgmo some other way.
     rev = "a" * 40
-    responses.add(
-        responses.GET,
-        HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(
-            branch="integration/autoland", rev=rev
-        ),
+    register_automation_relevance(
+        "integration/autoland",
+        rev,
         json={"error": f"unknown revision '{rev}'"},
         status=404,
     )
@@ -447,31 +340,30 @@ def test_push_does_not_exist(responses):
         p.id
 
 
-def test_push_bugs(responses):
+def test_push_bugs(register_automation_relevance):
     rev = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
 
-    responses.add(
-        responses.GET,
-        f"https://hg.mozilla.org/integration/autoland/json-automationrelevance/{rev}",
+    register_automation_relevance(
+        "integration/autoland",
+        rev,
         json={
             "changesets": [
                 {"bugs": [{"no": "1624503"}]},
                 {"bugs": [{"no": "1624503"}]},
             ]
         },
-        status=200,
     )
 
     p = Push(rev)
     assert p.bugs == {"1624503"}
 
 
-def test_push_bugs_different(responses):
+def test_push_bugs_different(register_automation_relevance):
     rev = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
 
-    responses.add(
-        responses.GET,
-        f"https://hg.mozilla.org/integration/autoland/json-automationrelevance/{rev}",
+    register_automation_relevance(
+        "integration/autoland",
+        rev,
         json={
             "changesets": [
                 {"bugs": [{"no": "1617050"}]},
@@ -482,19 +374,18 @@ def test_push_bugs_different(responses):
                 {"bugs": [{"no": "1595768"}]},
             ]
         },
-        status=200,
     )
 
     p = Push(rev)
     assert p.bugs == {"1617050", "1625220", "1595768"}
 
 
-def test_push_bugs_multiple(responses):
+def test_push_bugs_multiple(register_automation_relevance):
     rev = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
 
-    responses.add(
-        responses.GET,
-        f"https://hg.mozilla.org/integration/autoland/json-automationrelevance/{rev}",
+    register_automation_relevance(
+        "integration/autoland",
+        rev,
         json={
             "changesets": [
                 {"bugs": [{"no": "1617050"}, {"no": "123"}]},
@@ -502,7 +393,6 @@ def test_push_bugs_multiple(responses):
                 {"bugs": [{"no": "456"}]},
             ]
         },
-        status=200,
     )
 
     p = Push(rev)
@@ -517,7 +407,7 @@ def test_push_parent_on_autoland(responses):
     }
     responses.add(
         responses.GET,
-        HgRev.JSON_PUSHES_TEMPLATE.format(**ctx),
+        json_pushes_url(**ctx),
         json={
             "pushes": {
                 "122": {
@@ -538,7 +428,7 @@ def test_push_parent_on_autoland(responses):
     assert parent.rev == "bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"
 
 
-def test_push_parent_on_try(responses, create_changesets):
+def test_push_parent_on_try(register_automation_relevance, create_changesets):
     changesets = create_changesets(
         4,
         [
@@ -549,19 +439,11 @@ def test_push_parent_on_try(responses, create_changesets):
         ],
     )
 
-    from pprint import pprint
-
-    pprint(changesets, indent=2)
     head = changesets[-1]["node"]
     ctx = {"branch": "try", "rev": head}
 
     # We'll query the initial pushes' changesets first.
-    responses.add(
-        responses.GET,
-        HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(**ctx),
-        json={"changesets": changesets},
-        status=200,
-    )
+    register_automation_relevance(**ctx, json={"changesets": changesets})
 
     # Should find changesets[1] as the parent and then start searching for it.
     parent_rev = changesets[1]["node"]
@@ -569,32 +451,19 @@ def test_push_parent_on_try(responses, create_changesets):
     # First we'll search mozilla-central, but won't find parent_rev.
     ctx["rev"] = parent_rev
     ctx["branch"] = "mozilla-central"
-    responses.add(
-        responses.GET,
-        HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(**ctx),
-        json={"error": f"unknown revision '{parent_rev}'"},
-        status=404,
+    register_automation_relevance(
+        **ctx, json={"error": f"unknown revision '{parent_rev}'"}, status=404
     )
 
     # Next we'll search mozilla-beta, we'll find parent_rev but it's not a push head.
     ctx["branch"] = "mozilla-beta"
     changesets = create_changesets(4, {"phase": "public"})
-    responses.add(
-        responses.GET,
-        HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(**ctx),
-        json={"changesets": changesets},
-        status=200,
-    )
+    register_automation_relevance(**ctx, json={"changesets": changesets})
 
     # Finally we'll search mozilla-release, we find it and it's the push head!
     ctx["branch"] = "mozilla-release"
     changesets = create_changesets(2, {"phase": "public"}, head=3)
-    responses.add(
-        responses.GET,
-        HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(**ctx),
-        json={"changesets": changesets},
-        status=200,
-    )
+    register_automation_relevance(**ctx, json={"changesets": changesets})
 
     # Now run it and assert.
     push = Push(head, branch="try")
@@ -603,18 +472,18 @@ def test_push_parent_on_try(responses, create_changesets):
     assert parent.branch == "mozilla-release"
 
 
-def test_push_parent_on_try_fails_with_merge_commit(responses, create_changesets):
+def test_push_parent_on_try_fails_with_merge_commit(
+    register_automation_relevance, create_changesets
+):
     ctx = {
         "branch": "try",
         "rev": "a" * 40,
     }
 
     # Finding parent fails on merge commits.
-    responses.add(
-        responses.GET,
-        HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(**ctx),
+    register_automation_relevance(
+        **ctx,
         json={"changesets": create_changesets(1, {"parents": ["b" * 40, "c" * 40]})},
-        status=200,
     )
 
     push = Push(ctx["rev"], ctx["branch"])
@@ -622,35 +491,22 @@ def test_push_parent_on_try_fails_with_merge_commit(responses, create_changesets
         push.parent
 
 
-def test_push_parent_on_try_fails_when_not_a_push_head(responses, create_changesets):
+def test_push_parent_on_try_fails_when_not_a_push_head(
+    register_automation_relevance, create_changesets
+):
     changesets = create_changesets(3)
     head = changesets[-1]["node"]
     ctx = {
         "branch": "try",
         "rev": head,
     }
-    responses.add(
-        responses.GET,
-        HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(**ctx),
-        json={"changesets": changesets},
-        status=200,
-    )
+    register_automation_relevance(**ctx, json={"changesets": changesets})
 
     # We raise if rev is not found or a push head anywhere.
     ctx["rev"] = changesets[0]["parents"][0]
-    for branch in (
-        "mozilla-central",
-        "mozilla-beta",
-        "mozilla-release",
-        "integration/autoland",
-    ):
-        ctx["branch"] = branch
-        responses.add(
-            responses.GET,
-            HgRev.AUTOMATION_RELEVANCE_TEMPLATE.format(**ctx),
-            json={"changesets": changesets},
-            status=200,
-        )
+    payload = {"changesets": changesets}
+    for branch in PARENT_SEARCH_BRANCHES:
+        register_automation_relevance(branch, ctx["rev"], json=payload)
 
     push = Push(head, branch="try")
     with pytest.raises(ParentPushNotFound):
@@ -669,11 +525,7 @@ def test_push_child_raises(responses):
     # A push with no children raises.
     push = Push(rev, branch="integration/autoland")
     push._id = 100
-    url = HgRev.JSON_PUSHES_TEMPLATE.format(
-        branch=push.branch,
-        push_id_start=push.id,
-        push_id_end=push.id + 1,
-    )
+    url = json_pushes_url(push.branch, push.id, push.id + 1)
     responses.add(
         responses.GET,
         url,
@@ -685,17 +537,12 @@ def test_push_child_raises(responses):
         push.child
 
 
-def test_generate_all_shadow_scheduler_tasks(responses):
-    rev = "a" * 40
-    shadow_schedulers = (
-        (
-            "bar",
-            ["task-1", "task-3", "task-4"],
-        ),  # names will be generated alphabetically
-        ("foo", ["task-2", "task-4"]),
-    )
+def register_shadow_schedulers(responses, push, shadow_schedulers, task_payload):
+    """Register the decision task and shadow scheduler mocks for a push.
 
-    push = Push(rev)
+    ``task_payload`` builds the task-graph entry for a single item of a
+    scheduler's task list.
+    """
     responses.add(
         responses.GET,
         get_index_url(push.index + ".taskgraph.decision"),
@@ -728,18 +575,34 @@ def test_generate_all_shadow_scheduler_tasks(responses):
             responses.GET,
             get_artifact_url(s_id, "public/shadow-scheduler/optimized-tasks.json"),
             stream=True,
-            json={next(id): {"label": task} for task in ss[1]},
+            json={next(id): task_payload(task) for task in ss[1]},
             status=200,
         )
 
+
+def test_generate_all_shadow_scheduler_tasks(ordered_responses):
+    rev = "a" * 40
+    shadow_schedulers = (
+        (
+            "bar",
+            ["task-1", "task-3", "task-4"],
+        ),  # names will be generated alphabetically
+        ("foo", ["task-2", "task-4"]),
+    )
+
+    push = Push(rev)
+    register_shadow_schedulers(
+        ordered_responses, push, shadow_schedulers, lambda task: {"label": task}
+    )
+
     # retrieve the data
+    expected = [frozenset(ss[1]) for ss in shadow_schedulers]
     for i, (name, tasks) in enumerate(push.generate_all_shadow_scheduler_tasks()):
-        print(i, name, tasks)
         assert name == shadow_schedulers[i][0]
-        assert tasks == set(shadow_schedulers[i][1])
+        assert tasks == expected[i]
 
 
-def test_generate_all_shadow_scheduler_config_groups(responses):
+def test_generate_all_shadow_scheduler_config_groups(ordered_responses):
     rev = "a" * 40
     shadow_schedulers = (
         (
@@ -776,50 +639,17 @@ def test_generate_all_shadow_scheduler_config_groups(responses):
     )
 
     push = Push(rev)
-    responses.add(
-        responses.GET,
-        get_index_url(push.index + ".taskgraph.decision"),
-        json={"taskId": 1},
-        status=200,
-    )
-
-    id = count(2)
-    responses.add(
-        responses.GET,
-        get_artifact_url(1, "public/task-graph.json"),
-        json={
-            next(id): {"label": f"source-test-shadow-scheduler-{s[0]}"}
-            for s in shadow_schedulers
-        },
-        status=200,
+    register_shadow_schedulers(
+        ordered_responses,
+        push,
+        shadow_schedulers,
+        lambda task: {"label": task[0], "attributes": {"test_manifests": task[1]}},
     )
 
-    id = count(2)
-    for ss in shadow_schedulers:
-        s_id = next(id)
-        responses.add(
-            responses.GET,
-            get_index_url(f"{push.index}.source.shadow-scheduler-{ss[0]}"),
-            json={"taskId": s_id},
-            status=200,
-        )
-
-        responses.add(
-            responses.GET,
-            get_artifact_url(s_id, "public/shadow-scheduler/optimized-tasks.json"),
-            stream=True,
-            json={
-                next(id): {"label": label, "attributes": {"test_manifests": groups}}
-                for label, groups in ss[1]
-            },
-            status=200,
-        )
-
     # retrieve the data
     for i, (name, config_groups) in enumerate(
         push.generate_all_shadow_scheduler_config_groups()
     ):
-        print(i, name, config_groups)
         assert name == shadow_schedulers[i][0]
         assert config_groups == shadow_schedulers[i][2]
 
@@ -852,7 +682,7 @@ def test_iterate_children(responses):
                 + i: {
                     "changesets": [
                         {
-                            "node": chr(ord("a") + i) * 40,
+                            "node": NODES[i],
                             "desc": "A nice description about Bug 1234567",
                         }
                     ],
@@ -897,7 +727,7 @@ def test_iterate_parents(responses):
                 - i: {
                     "changesets": [
                         {
-                            "node": chr(ord("a") + i) * 40,
+                            "node": NODES[i],
                             "desc": "A nice description about Bug 1234567",
                         }
                     ],
@@ -914,16 +744,41 @@ def test_iterate_parents(responses):
         push_id -= 1
 
 
-def test_get_test_selection_data_from_cache(responses):
-    rev = "a" * 40
-    branch = "autoland"
-    push = Push(rev, branch)
+@pytest.fixture
+def bugbug_urls(responses):
+    """Pre-registers the endpoints shared by the bugbug test selection
+    tests: the decision task lookup (200) and the cached schedules
+    artifact (404, forcing a fall through to the bugbug service).
 
-    task_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/index/v1/task/gecko.v2.{branch}.revision.{rev}.taskgraph.decision"
+    Returns the three URLs involved plus a callable registering the
+    bugbug schedules endpoint with the desired status.
+    """
+    task_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/index/v1/task/gecko.v2.{BRANCH}.revision.{REV}.taskgraph.decision"
     responses.add(responses.GET, task_url, status=200, json={"taskId": "a" * 10})
 
     cache_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/queue/v1/task/aaaaaaaaaa/artifacts/public/bugbug-push-schedules.json"
-    responses.add(responses.GET, cache_url, status=200, json=SCHEDULES_EXTRACT)
+    responses.add(responses.GET, cache_url, status=404)
+
+    url = f"{bugbug.BUGBUG_BASE_URL}/push/{BRANCH}/{REV}/schedules"
+
+    def register_schedules(status, **kwargs):
+        responses.add(responses.GET, url, status=status, **kwargs)
+
+    return task_url, cache_url, url, register_schedules
+
+
+def test_get_test_selection_data_from_cache(responses, push):
+    task_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/index/v1/task/gecko.v2.{BRANCH}.revision.{REV}.taskgraph.decision"
+    responses.add(responses.GET, task_url, status=200, json={"taskId": "a" * 10})
+
+    cache_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/queue/v1/task/aaaaaaaaaa/artifacts/public/bugbug-push-schedules.json"
+    responses.add(
+        responses.GET,
+        cache_url,
+        status=200,
+        body=SCHEDULES_EXTRACT_BODY,
+        content_type="application/json",
+    )
 
     data = push.get_test_selection_data()
     assert data == SCHEDULES_EXTRACT
@@ -935,22 +790,17 @@ def test_get_test_selection_data_from_cache(responses):
     ]
 
 
-def test_get_test_selection_data_from_bugbug_handle_errors(responses, monkeypatch):
-    rev = "a" * 40
-    branch = "autoland"
-    push = Push(rev, branch)
-
-    task_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/index/v1/task/gecko.v2.{branch}.revision.{rev}.taskgraph.decision"
-    responses.add(responses.GET, task_url, status=200, json={"taskId": "a" * 10})
-
-    cache_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/queue/v1/task/aaaaaaaaaa/artifacts/public/bugbug-push-schedules.json"
-    responses.add(responses.GET, cache_url, status=404)
-
-    url = f"{bugbug.BUGBUG_BASE_URL}/push/{branch}/{rev}/schedules"
-    responses.add(responses.GET, url, status=500)
+def test_get_test_selection_data_from_bugbug_handle_errors(
+    responses, monkeypatch, push, bugbug_urls
+):
+    task_url, cache_url, url, register_schedules = bugbug_urls
+    register_schedules(500)
 
     monkeypatch.setattr(bugbug, "DEFAULT_RETRY_TIMEOUT", 3)
     monkeypatch.setattr(bugbug, "DEFAULT_RETRY_INTERVAL", 1)
+    # Keep the retry loop running but don't pay the wall-clock cost of
+    # actually sleeping between attempts.
+    monkeypatch.setattr(bugbug.time, "sleep", lambda interval: None)
     with pytest.raises(SourcesNotFound) as e:
         push.get_test_selection_data()
     assert (
@@ -970,23 +820,16 @@ def test_get_test_selection_data_from_bugbug_handle_errors(responses, monkeypatc
 
 
 def test_get_test_selection_data_from_bugbug_handle_exceeded_timeout(
-    responses, monkeypatch
+    responses, monkeypatch, push, bugbug_urls
 ):
-    rev = "a" * 40
-    branch = "autoland"
-    push = Push(rev, branch)
-
-    task_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/index/v1/task/gecko.v2.{branch}.revision.{rev}.taskgraph.decision"
-    responses.add(responses.GET, task_url, status=200, json={"taskId": "a" * 10})
-
-    cache_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/queue/v1/task/aaaaaaaaaa/artifacts/public/bugbug-push-schedules.json"
-    responses.add(responses.GET, cache_url, status=404)
-
-    url = f"{bugbug.BUGBUG_BASE_URL}/push/{branch}/{rev}/schedules"
-    responses.add(responses.GET, url, status=202)
+    task_url, cache_url, url, register_schedules = bugbug_urls
+    register_schedules(202)
 
     monkeypatch.setattr(bugbug, "DEFAULT_RETRY_TIMEOUT", 3)
     monkeypatch.setattr(bugbug, "DEFAULT_RETRY_INTERVAL", 1)
+    # The retry count (asserted below) covers the loop's behavior; no
+    # need to actually sleep between attempts.
+    monkeypatch.setattr(bugbug.time, "sleep", lambda interval: None)
     with pytest.raises(bugbug.BugbugTimeoutException) as e:
         push.get_test_selection_data()
     assert str(e.value) == "Timed out waiting for result from Bugbug HTTP Service"
@@ -1002,19 +845,11 @@ def test_get_test_selection_data_from_bugbug_handle_exceeded_timeout(
     ]
 
 
-def test_get_test_selection_data_from_bugbug(responses):
-    rev = "a" * 40
-    branch = "autoland"
-    push = Push(rev, branch)
-
-    task_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/index/v1/task/gecko.v2.{branch}.revision.{rev}.taskgraph.decision"
-    responses.add(responses.GET, task_url, status=200, json={"taskId": "a" * 10})
-
-    cache_url = f"{PRODUCTION_TASKCLUSTER_ROOT_URL}/api/queue/v1/task/aaaaaaaaaa/artifacts/public/bugbug-push-schedules.json"
-    responses.add(responses.GET, cache_url, status=404)
-
-    url = f"{bugbug.BUGBUG_BASE_URL}/push/{branch}/{rev}/schedules"
-    responses.add(responses.GET, url, status=200, json=SCHEDULES_EXTRACT)
+def test_get_test_selection_data_from_bugbug(responses, push, bugbug_urls):
+    task_url, cache_url, url, register_schedules = bugbug_urls
+    register_schedules(
+        200, body=SCHEDULES_EXTRACT_BODY, content_type="application/json"
+    )
 
     data = push.get_test_selection_data()
     assert data == SCHEDULES_EXTRACT
@@ -1027,339 +862,329 @@ def test_get_test_selection_data_from_bugbug(responses):
     ]
 
 
-@pytest.mark.parametrize(
-    "classify_regressions_return_value, expected_result",
-    [
-        (Regressions(real={"group1": []}, intermittent={}, unknown={}), PushStatus.BAD),
-        (
-            Regressions(real={"group1": []}, intermittent={"group2": []}, unknown={}),
-            PushStatus.BAD,
-        ),
-        (
-            Regressions(real={"group1": []}, intermittent={}, unknown={"group2": []}),
-            PushStatus.BAD,
-        ),
-        (Regressions(real={}, intermittent={}, unknown={}), PushStatus.GOOD),
-        (
-            Regressions(real={}, intermittent={"group1": []}, unknown={}),
-            PushStatus.GOOD,
-        ),
-        (
-            Regressions(real={}, intermittent={"group1": [], "group2": []}, unknown={}),
-            PushStatus.GOOD,
-        ),
-        (
-            Regressions(real={}, intermittent={}, unknown={"group1": []}),
-            PushStatus.UNKNOWN,
-        ),
-        (
-            Regressions(real={}, intermittent={"group1": []}, unknown={"group2": []}),
-            PushStatus.UNKNOWN,
-        ),
-    ],
+# Parametrize tables for the classify tests, frozen at module level so
+# they are built once and shared across collections. Only the inputs
+# are tabled; the expected status is derived by _expected_status below.
+_CLASSIFY_CASES = (
+    Regressions(real={"group1": []}, intermittent={}, unknown={}),
+    Regressions(real={"group1": []}, intermittent={"group2": []}, unknown={}),
+    Regressions(real={"group1": []}, intermittent={}, unknown={"group2": []}),
+    Regressions(real={}, intermittent={}, unknown={}),
+    Regressions(real={}, intermittent={"group1": []}, unknown={}),
+    Regressions(real={}, intermittent={"group1": [], "group2": []}, unknown={}),
+    Regressions(real={}, intermittent={}, unknown={"group1": []}),
+    Regressions(real={}, intermittent={"group1": []}, unknown={"group2": []}),
 )
-def test_classify(monkeypatch, classify_regressions_return_value, expected_result):
-    rev = "a" * 40
-    branch = "autoland"
-    push = Push(rev, branch)
 
+
+# Shared by every test_classify case; classify only inspects the
+# Regressions half of the return value.
+_EMPTY_RETRIGGER = ToRetriggerOrBackfill(
+    real_retrigger={},
+    intermittent_retrigger={},
+    backfill={},
+)
+
+
+def _expected_status(regressions):
+    """The status classify should assign for a set of regressions: any
+    real regression makes the push BAD, otherwise any unknown one makes
+    it UNKNOWN, otherwise it is GOOD."""
+    if regressions.real:
+        return PushStatus.BAD
+    if regressions.unknown:
+        return PushStatus.UNKNOWN
+    return PushStatus.GOOD
+
+
+# Compact ids keep pytest from repr'ing the Regressions rows at
+# collection time and in -v output.
+_CLASSIFY_IDS = (
+    "real",
+    "real-intermittent",
+    "real-unknown",
+    "none",
+    "intermittent",
+    "two-intermittent",
+    "unknown",
+    "intermittent-unknown",
+)
+
+
+@pytest.mark.parametrize(
+    "classify_regressions_return_value", _CLASSIFY_CASES, ids=_CLASSIFY_IDS
+)
+def test_classify(monkeypatch, push, classify_regressions_return_value):
     def mock_return(self, *args, **kwargs):
-        return classify_regressions_return_value, ToRetriggerOrBackfill(
-            real_retrigger={},
-            intermittent_retrigger={},
-            backfill={},
-        )
+        return classify_regressions_return_value, _EMPTY_RETRIGGER
 
     monkeypatch.setattr(Push, "classify_regressions", mock_return)
-    assert push.classify()[0] == expected_result
+    assert push.classify()[0] == _expected_status(classify_regressions_return_value)
 
 
-def generate_mocks(
-    monkeypatch,
-    push,
-    get_test_selection_data_value,
-    get_likely_regressions_value,
-    get_possible_regressions_value,
-    cross_config_values,
-):
-    monkeypatch.setattr(config.cache, "get", lambda x: None)
-    monkeypatch.setattr(Push, "is_group_running", lambda *args: False)
+# Canonical revision and branch shared by the classify tests, so the
+# string multiplication happens once at import.
+REV = "a" * 40
+BRANCH = "autoland"
 
-    def mock_return_get_test_selection_data(*args, **kwargs):
-        return get_test_selection_data_value
 
-    monkeypatch.setattr(
-        Push, "get_test_selection_data", mock_return_get_test_selection_data
-    )
+@pytest.fixture
+def push():
+    """A fresh Push on autoland.
 
-    def mock_return_get_likely_regressions(*args, **kwargs):
-        return get_likely_regressions_value
+    The constructor is cheap and lazy (no I/O until a property is
+    accessed), so a function-scoped instance is built per test rather
+    than copying a shared template the mocks could leak state into.
+    """
+    return Push(REV, BRANCH)
 
-    monkeypatch.setattr(
-        Push, "get_likely_regressions", mock_return_get_likely_regressions
-    )
 
-    def mock_return_get_possible_regressions(*args, **kwargs):
-        return get_possible_regressions_value
+# Static patch targets shared by every classify test, allocated once
+# instead of one lambda per call.
+def _no_cached_value(key):
+    return None
 
-    monkeypatch.setattr(
-        Push, "get_possible_regressions", mock_return_get_possible_regressions
-    )
 
-    push.group_summaries = GROUP_SUMMARIES_DEFAULT
-    for index, group in enumerate(push.group_summaries.values()):
-        monkeypatch.setattr(
-            group,
-            "is_cross_config_failure",
-            lambda x, index=index: cross_config_values[index],
-        )
-        monkeypatch.setattr(
-            group,
-            "is_config_consistent_failure",
-            lambda x, index=index: cross_config_values[index],
-        )
+def _not_running(*args):
+    return False
+
+
+# GroupSummary methods generate_mocks patches identically on every group.
+_PATCHED_GROUP_METHODS = ("is_cross_config_failure", "is_config_consistent_failure")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _static_mocks():
+    """Patches identical across every classify case, installed once per
+    module instead of once per test.
+
+    ``mock.patch.object`` is used because ``monkeypatch`` is
+    function-scoped. Tests needing different behavior layer their own
+    patches (or a ``fake_cache``) on top.
+    """
+    with mock.patch.object(config.cache, "get", _no_cached_value), mock.patch.object(
+        Push, "is_group_running", _not_running
+    ):
+        yield
+
+
+@pytest.fixture
+def generate_mocks(monkeypatch):
+    """Returns a closure patching everything ``push.classify`` needs.
+
+    Only the values that actually vary per parametrization are bound per
+    call; the static parts are shared module-level constants. The Push
+    method patches are applied directly and undone by a single teardown
+    instead of one monkeypatch record each.
+    """
+    originals = {}
+
+    def inner(
+        push,
+        get_test_selection_data_value,
+        get_likely_regressions_value,
+        get_possible_regressions_value,
+        cross_config_values,
+    ):
+        push_values = {
+            "get_test_selection_data": get_test_selection_data_value,
+            "get_likely_regressions": get_likely_regressions_value,
+            "get_possible_regressions": get_possible_regressions_value,
+        }
+        for name, value in push_values.items():
+            originals.setdefault(name, getattr(Push, name))
+
+            def mock_return(*args, value=value, **kwargs):
+                return value
+
+            setattr(Push, name, mock_return)
+
+        push.group_summaries = _build_group_summaries_default()
+        for index, group in enumerate(push.group_summaries.values()):
+            # Both methods answer with the same per-group value, looked
+            # up once here and served by one shared closure.
+            def mock_value(x, value=cross_config_values[index]):
+                return value
+
+            for attr in _PATCHED_GROUP_METHODS:
+                monkeypatch.setattr(group, attr, mock_value)
+
+    yield inner
+
+    for name, original in originals.items():
+        setattr(Push, name, original)
+
+
+# Expected classify outputs, precomputed once at import so each case
+# carries its full expectation instead of rebuilding it per invocation.
+_ALL_GROUPS_UNKNOWN = Regressions(
+    real={},
+    intermittent={},
+    unknown={group: make_tasks(group) for group in _GROUPS},
+)
+_ALL_GROUPS_INTERMITTENT = Regressions(
+    real={},
+    intermittent={group: make_tasks(group) for group in _GROUPS},
+    unknown={},
+)
+
+
+def _to_retrigger(**groups_by_category):
+    """A ToRetriggerOrBackfill mapping each listed category's groups to
+    their expected tasks, with the remaining categories empty."""
+    categories = {"real_retrigger": {}, "intermittent_retrigger": {}, "backfill": {}}
+    for category, groups in groups_by_category.items():
+        categories[category] = {group: make_tasks(group) for group in groups}
+    return ToRetriggerOrBackfill(**categories)
+
+
+_ALMOST_GOOD_PUSH_CASES = (
+    (
+        {"groups": {"group1": 0.7, "group2": 0.3}},
+        _ALL_CROSS_CONFIG,
+        _to_retrigger(intermittent_retrigger=_GROUPS),
+    ),  # There are only cross-config failures with low confidence
+    (
+        {"groups": dict.fromkeys(_GROUPS, 0.85)},
+        _NO_CROSS_CONFIG,
+        _EMPTY_RETRIGGER,
+    ),  # There are only non cross-config failures with medium confidence
+    (
+        {
+            "groups": {
+                "group1": 0.7,
+                "group2": 0.85,
+                "group3": 0.3,
+                "group4": 0.85,
+                "group5": 0.3,
+            }
+        },
+        _ALTERNATING_CROSS_CONFIG,
+        _to_retrigger(intermittent_retrigger=("group1", "group3", "group5")),
+    ),  # There are some non cross-config failures and some low confidence groups but they don't match
+)
+
+
+_ALMOST_GOOD_PUSH_IDS = (
+    "cross-config-low-confidence",
+    "non-cross-config-medium-confidence",
+    "non-matching-low-confidence",
+)
 
 
 @pytest.mark.parametrize(
     "test_selection_data, are_cross_config, to_retrigger",
-    [
-        (
-            {"groups": {"group1": 0.7, "group2": 0.3}},
-            [True for i in range(0, len(GROUP_SUMMARIES_DEFAULT))],
-            {
-                "intermittent_retrigger": [
-                    "group1",
-                    "group2",
-                    "group3",
-                    "group4",
-                    "group5",
-                ]
-            },
-        ),  # There are only cross-config failures with low confidence
-        (
-            {
-                "groups": {
-                    "group1": 0.85,
-                    "group2": 0.85,
-                    "group3": 0.85,
-                    "group4": 0.85,
-                    "group5": 0.85,
-                }
-            },
-            [False for i in range(0, len(GROUP_SUMMARIES_DEFAULT))],
-            {},
-        ),  # There are only non cross-config failures with medium confidence
-        (
-            {
-                "groups": {
-                    "group1": 0.7,
-                    "group2": 0.85,
-                    "group3": 0.3,
-                    "group4": 0.85,
-                    "group5": 0.3,
-                }
-            },
-            [False if i % 2 else True for i in range(0, len(GROUP_SUMMARIES_DEFAULT))],
-            {"intermittent_retrigger": ["group1", "group3", "group5"]},
-        ),  # There are some non cross-config failures and some low confidence groups but they don't match
-    ],
+    _ALMOST_GOOD_PUSH_CASES,
+    ids=_ALMOST_GOOD_PUSH_IDS,
 )
 def test_classify_almost_good_push(
-    monkeypatch, test_selection_data, are_cross_config, to_retrigger
+    generate_mocks, push, test_selection_data, are_cross_config, to_retrigger
 ):
-    rev = "a" * 40
-    branch = "autoland"
-    push = Push(rev, branch)
     generate_mocks(
-        monkeypatch,
         push,
         test_selection_data,
-        set(),
-        set(),
+        _NO_REGRESSIONS,
+        _NO_REGRESSIONS,
         are_cross_config,
     )
 
-    to_retrigger_or_backill = {
-        "real_retrigger": {},
-        "intermittent_retrigger": {},
-        "backfill": {},
-    }
-    for key, groups in to_retrigger.items():
-        to_retrigger[key] = {group: make_tasks(group) for group in groups}
-    to_retrigger_or_backill.update(to_retrigger)
-
     assert push.classify(
         unknown_from_regressions=False,
         consistent_failures_counts=None,
         consider_children_pushes_configs=False,
-    ) == (
-        PushStatus.UNKNOWN,
-        Regressions(
-            real={},
-            intermittent={},
-            unknown={
-                "group1": make_tasks("group1"),
-                "group2": make_tasks("group2"),
-                "group3": make_tasks("group3"),
-                "group4": make_tasks("group4"),
-                "group5": make_tasks("group5"),
-            },
-        ),
-        ToRetriggerOrBackfill(**to_retrigger_or_backill),
-    )
+    ) == (PushStatus.UNKNOWN, _ALL_GROUPS_UNKNOWN, to_retrigger)
 
 
-def test_classify_good_push_only_intermittent_failures(monkeypatch):
-    rev = "a" * 40
-    branch = "autoland"
-    push = Push(rev, branch)
-
+def test_classify_good_push_only_intermittent_failures(generate_mocks, push):
     test_selection_data = {"groups": {"group1": 0.7, "group2": 0.3}}
     likely_regressions = {"group3", "group4"}
-    are_cross_config = [False for i in range(0, len(GROUP_SUMMARIES_DEFAULT))]
+    are_cross_config = _NO_CROSS_CONFIG
     generate_mocks(
-        monkeypatch,
         push,
         test_selection_data,
         likely_regressions,
-        set(),
+        _NO_REGRESSIONS,
         are_cross_config,
     )
 
+    # All groups aren't cross config failures and were either selected by bugbug
+    # with low confidence or not at all (no confidence)
     assert push.classify(consider_children_pushes_configs=False) == (
         PushStatus.GOOD,
-        Regressions(
-            real={},
-            # All groups aren't cross config failures and were either selected by bugbug
-            # with low confidence or not at all (no confidence)
-            intermittent={
-                "group1": make_tasks("group1"),
-                "group2": make_tasks("group2"),
-                "group3": make_tasks("group3"),
-                "group4": make_tasks("group4"),
-                "group5": make_tasks("group5"),
-            },
-            unknown={},
-        ),
-        ToRetriggerOrBackfill(
-            real_retrigger={},
-            intermittent_retrigger={},
-            backfill={},
-        ),
+        _ALL_GROUPS_INTERMITTENT,
+        _EMPTY_RETRIGGER,
     )
 
 
+_ALMOST_BAD_PUSH_CASES = (
+    (
+        {"groups": {}},
+        set(_GROUPS),
+        _ALL_CROSS_CONFIG,
+        _to_retrigger(intermittent_retrigger=_GROUPS),
+    ),  # There are only cross-config failures likely to regress
+    # but they weren't selected by bugbug (no confidence)
+    (
+        {"groups": dict.fromkeys(_GROUPS, 0.92)},
+        _NO_REGRESSIONS,
+        _ALL_CROSS_CONFIG,
+        _EMPTY_RETRIGGER,
+    ),  # There are only cross-config failures that were selected
+    # with high confidence by bugbug but weren't likely to regress
+    (
+        {"groups": dict.fromkeys(_GROUPS, 0.92)},
+        set(_GROUPS),
+        _NO_CROSS_CONFIG,
+        _to_retrigger(real_retrigger=_GROUPS),
+    ),  # There are only groups that were selected with high confidence by
+    # bugbug and also likely to regress but they aren't cross-config failures
+)
+
+
+_ALMOST_BAD_PUSH_IDS = (
+    "likely-regressions-without-confidence",
+    "high-confidence-not-likely-to-regress",
+    "non-cross-config-failures",
+)
+
+
 @pytest.mark.parametrize(
     "test_selection_data, likely_regressions, are_cross_config, to_retrigger",
-    [
-        (
-            {"groups": {}},
-            {"group1", "group2", "group3", "group4", "group5"},
-            [True for i in range(0, len(GROUP_SUMMARIES_DEFAULT))],
-            {
-                "intermittent_retrigger": [
-                    "group1",
-                    "group2",
-                    "group3",
-                    "group4",
-                    "group5",
-                ]
-            },
-        ),  # There are only cross-config failures likely to regress
-        # but they weren't selected by bugbug (no confidence)
-        (
-            {
-                "groups": {
-                    "group1": 0.92,
-                    "group2": 0.92,
-                    "group3": 0.92,
-                    "group4": 0.92,
-                    "group5": 0.92,
-                }
-            },
-            set(),
-            [True for i in range(0, len(GROUP_SUMMARIES_DEFAULT))],
-            {},
-        ),  # There are only cross-config failures that were selected
-        # with high confidence by bugbug but weren't likely to regress
-        (
-            {
-                "groups": {
-                    "group1": 0.92,
-                    "group2": 0.92,
-                    "group3": 0.92,
-                    "group4": 0.92,
-                    "group5": 0.92,
-                }
-            },
-            {"group1", "group2", "group3", "group4", "group5"},
-            [False for i in range(0, len(GROUP_SUMMARIES_DEFAULT))],
-            {"real_retrigger": ["group1", "group2", "group3", "group4", "group5"]},
-        ),  # There are only groups that were selected with high confidence by
-        # bugbug and also likely to regress but they aren't cross-config failures
-    ],
+    _ALMOST_BAD_PUSH_CASES,
+    ids=_ALMOST_BAD_PUSH_IDS,
 )
 def test_classify_almost_bad_push(
-    monkeypatch, test_selection_data, likely_regressions, are_cross_config, to_retrigger
+    generate_mocks,
+    push,
+    test_selection_data,
+    likely_regressions,
+    are_cross_config,
+    to_retrigger,
 ):
-    rev = "a" * 40
-    branch = "autoland"
-    push = Push(rev, branch)
     generate_mocks(
-        monkeypatch,
         push,
         test_selection_data,
         likely_regressions,
-        set(),
+        _NO_REGRESSIONS,
         are_cross_config,
     )
 
-    to_retrigger_or_backill = {
-        "real_retrigger": {},
-        "intermittent_retrigger": {},
-        "backfill": {},
-    }
-    for key, groups in to_retrigger.items():
-        to_retrigger[key] = {group: make_tasks(group) for group in groups}
-    to_retrigger_or_backill.update(to_retrigger)
-
     assert push.classify(
         unknown_from_regressions=False,
         consistent_failures_counts=None,
         consider_children_pushes_configs=False,
-    ) == (
-        PushStatus.UNKNOWN,
-        Regressions(
-            real={},
-            intermittent={},
-            unknown={
-                "group1": make_tasks("group1"),
-                "group2": make_tasks("group2"),
-                "group3": make_tasks("group3"),
-                "group4": make_tasks("group4"),
-                "group5": make_tasks("group5"),
-            },
-        ),
-        ToRetriggerOrBackfill(**to_retrigger_or_backill),
-    )
-
+    ) == (PushStatus.UNKNOWN, _ALL_GROUPS_UNKNOWN, to_retrigger)
 
-def test_classify_bad_push_some_real_failures(monkeypatch):
-    rev = "a" * 40
-    branch = "autoland"
-    push = Push(rev, branch)
 
+def test_classify_bad_push_some_real_failures(generate_mocks, push):
     test_selection_data = {"groups": {"group1": 0.99, "group2": 0.95, "group3": 0.91}}
     likely_regressions = {"group1", "group2", "group3"}
-    are_cross_config = [
-        False if i % 2 else True for i in range(0, len(GROUP_SUMMARIES_DEFAULT))
-    ]
+    are_cross_config = _ALTERNATING_CROSS_CONFIG
     generate_mocks(
-        monkeypatch,
         push,
         test_selection_data,
         likely_regressions,
-        set(),
+        _NO_REGRESSIONS,
         are_cross_config,
     )
 